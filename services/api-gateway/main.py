@@ -5,21 +5,44 @@ Provides unified interface for all AI services
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 import httpx
+import asyncio
 import os
 import logging
+import time
 from datetime import datetime
+from contextlib import asynccontextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client for upstream service calls (keeps connections alive)
+http_client = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events"""
+    global http_client
+    # Startup
+    http_client = httpx.AsyncClient()
+    logger.info("Upstream HTTP client created")
+    
+    yield
+    
+    # Shutdown
+    await http_client.aclose()
+    logger.info("Upstream HTTP client closed")
+
 app = FastAPI(
     title="AI Orchestration System API Gateway",
     description="Unified API for 3D/4D generation, crypto prediction, and AI services",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -66,50 +89,63 @@ class OrchestrationRequest(BaseModel):
     tasks: List[Dict[str, Any]]
     priority: Optional[str] = "normal"
 
+# Per-second cache for the health check timestamp
+_health_ts = [0, ""]  # [epoch second, formatted timestamp]
+
+def health_timestamp() -> str:
+    """UTC timestamp truncated to the second, formatted once per second"""
+    now = int(time.time())
+    if now != _health_ts[0]:
+        _health_ts[1] = datetime.utcfromtimestamp(now).isoformat()
+        _health_ts[0] = now
+    return _health_ts[1]
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": health_timestamp(),
         "version": "1.0.0"
     }
 
+# Per-service health probe used by /status
+async def check_service(service_url: str) -> Dict[str, Any]:
+    """Probe a single service's health endpoint and report its status"""
+    try:
+        response = await http_client.get(f"{service_url}/health", timeout=5.0)
+        return {
+            "status": "healthy" if response.status_code == 200 else "unhealthy",
+            "url": service_url
+        }
+    except Exception as e:
+        return {
+            "status": "unreachable",
+            "error": str(e),
+            "url": service_url
+        }
+
 # Service status endpoint
 @app.get("/status")
 async def get_status():
     """Get status of all services"""
-    status = {}
-    async with httpx.AsyncClient() as client:
-        for service_name, service_url in SERVICES.items():
-            try:
-                response = await client.get(f"{service_url}/health", timeout=5.0)
-                status[service_name] = {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "url": service_url
-                }
-            except Exception as e:
-                status[service_name] = {
-                    "status": "unreachable",
-                    "error": str(e),
-                    "url": service_url
-                }
-    return status
+    # Probe all services concurrently; latency is the slowest probe, not the sum
+    results = await asyncio.gather(*(check_service(url) for url in SERVICES.values()))
+    return dict(zip(SERVICES.keys(), results))
 
 # Image Generation endpoints
 @app.post('/api/v1/generate/image')
 async def generate_image(request: ImageGenerationRequest):
     """Generate 3D/4D images with HDR and PBR rendering"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVICES['image_generation']}/generate",
-                json=request.dict(),
-                timeout=300.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.post(
+            f"{SERVICES['image_generation']}/generate",
+            json=request.dict(),
+            timeout=300.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Image generation failed: {e}")
         raise HTTPException(status_code=500, detail="Image generation service error")
@@ -119,14 +155,13 @@ async def generate_image(request: ImageGenerationRequest):
 async def generate_video(request: VideoGenerationRequest):
     """Generate 8K video with NeRF rendering"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVICES['video_generation']}/generate",
-                json=request.dict(),
-                timeout=600.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.post(
+            f"{SERVICES['video_generation']}/generate",
+            json=request.dict(),
+            timeout=600.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Video generation failed: {e}")
         raise HTTPException(status_code=500, detail="Video generation service error")
@@ -136,14 +171,13 @@ async def generate_video(request: VideoGenerationRequest):
 async def predict_crypto(request: CryptoPredictionRequest):
     """Predict cryptocurrency prices using LSTM/Transformer models"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVICES['crypto_prediction']}/predict",
-                json=request.dict(),
-                timeout=60.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.post(
+            f"{SERVICES['crypto_prediction']}/predict",
+            json=request.dict(),
+            timeout=60.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Crypto prediction failed: {e}")
         raise HTTPException(status_code=500, detail="Crypto prediction service error")
@@ -152,13 +186,12 @@ async def predict_crypto(request: CryptoPredictionRequest):
 async def get_sentiment_analysis(symbol: str):
     """Get sentiment analysis for a cryptocurrency"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{SERVICES['crypto_prediction']}/sentiment/{symbol}",
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.get(
+            f"{SERVICES['crypto_prediction']}/sentiment/{symbol}",
+            timeout=30.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Sentiment analysis failed: {e}")
         raise HTTPException(status_code=500, detail="Sentiment analysis service error")
@@ -168,14 +201,13 @@ async def get_sentiment_analysis(symbol: str):
 async def orchestrate_tasks(request: OrchestrationRequest):
     """Orchestrate multiple AI tasks"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVICES['orchestrator']}/orchestrate",
-                json=request.dict(),
-                timeout=600.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.post(
+            f"{SERVICES['orchestrator']}/orchestrate",
+            json=request.dict(),
+            timeout=600.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Orchestration failed: {e}")
         raise HTTPException(status_code=500, detail="Orchestration service error")
@@ -185,14 +217,13 @@ async def orchestrate_tasks(request: OrchestrationRequest):
 async def analyze_fraud(data: Dict[str, Any]):
     """Analyze transaction for potential fraud"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVICES['fraud_detection']}/analyze",
-                json=data,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await http_client.post(
+            f"{SERVICES['fraud_detection']}/analyze",
+            json=data,
+            timeout=30.0
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         logger.error(f"Fraud analysis failed: {e}")
         raise HTTPException(status_code=500, detail="Fraud detection service error")
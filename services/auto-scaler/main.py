@@ -3,27 +3,60 @@ Auto-Scaler Service
 Monitors resource usage and scales services automatically
 """
 
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
+from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 import psutil
 import logging
 from datetime import datetime
 import os
+import time
+from threading import Lock
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Prometheus instrumentation for the metrics sample cache
+METRICS_CACHE_LOOKUPS = Counter(
+    'autoscaler_metrics_cache_lookups_total',
+    'Metrics sample cache lookups',
+    ['result']
+)
+METRICS_SAMPLE_SECONDS = Histogram(
+    'autoscaler_metrics_sample_seconds',
+    'Time spent sampling system metrics from psutil'
+)
+
 class AutoScaler:
     """Auto-scaling engine based on metrics"""
     
     def __init__(self):
         self.scale_up_threshold = int(os.getenv('SCALE_UP_THRESHOLD', 80))
         self.scale_down_threshold = int(os.getenv('SCALE_DOWN_THRESHOLD', 20))
+        # Sampling CPU blocks for a full second, so samples are reused for
+        # this many seconds across /metrics and /scaling-decision requests
+        self.metrics_ttl = float(os.getenv('METRICS_CACHE_TTL', 5))
+        self._metrics_cache = None
+        self._metrics_sampled_at = 0.0
+        self._metrics_lock = Lock()
         logger.info(f"Auto-scaler initialized: up={self.scale_up_threshold}%, down={self.scale_down_threshold}%")
     
     def get_metrics(self):
-        """Get current system metrics"""
+        """Get current system metrics, reusing a recent sample if available"""
+        with self._metrics_lock:
+            now = time.monotonic()
+            if self._metrics_cache is None or now - self._metrics_sampled_at >= self.metrics_ttl:
+                METRICS_CACHE_LOOKUPS.labels(result='miss').inc()
+                with METRICS_SAMPLE_SECONDS.time():
+                    self._metrics_cache = self._sample_metrics()
+                self._metrics_sampled_at = time.monotonic()
+            else:
+                METRICS_CACHE_LOOKUPS.labels(result='hit').inc()
+            return self._metrics_cache
+    
+    def _sample_metrics(self):
+        """Sample system metrics from psutil"""
         return {
             'cpu_percent': psutil.cpu_percent(interval=1),
             'memory_percent': psutil.virtual_memory().percent,
@@ -51,6 +84,11 @@ def health():
 def metrics():
     return jsonify(scaler.get_metrics())
 
+@app.route('/prometheus', methods=['GET'])
+def prometheus_metrics():
+    """Expose Prometheus metrics (/metrics already serves the JSON sample)"""
+    return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
+
 @app.route('/scaling-decision', methods=['GET'])
 def scaling_decision():
     metrics = scaler.get_metrics()
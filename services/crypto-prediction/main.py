@@ -9,11 +9,9 @@ from flask import Flask, request, jsonify
 import torch
 import torch.nn as nn
 import numpy as np
-import pandas as pd
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -78,22 +76,25 @@ class CryptoPredictor:
             # In production, use pycoingecko or binance API
             logger.info(f"Fetching market data for {symbol}, timeframe={timeframe}")
             
-            # Simulated historical data
+            # Simulated historical data, generated column-wise in one pass
             now = datetime.utcnow()
-            data = []
+            opens = (50000 + np.random.randn(limit) * 1000).tolist()
+            highs = (51000 + np.random.randn(limit) * 1000).tolist()
+            lows = (49000 + np.random.randn(limit) * 1000).tolist()
+            closes = (50500 + np.random.randn(limit) * 1000).tolist()
+            volumes = (1000000 + np.random.randn(limit) * 100000).tolist()
             
-            for i in range(limit):
-                timestamp = now - timedelta(hours=limit-i)
-                data.append({
-                    'timestamp': timestamp.isoformat(),
-                    'open': 50000 + np.random.randn() * 1000,
-                    'high': 51000 + np.random.randn() * 1000,
-                    'low': 49000 + np.random.randn() * 1000,
-                    'close': 50500 + np.random.randn() * 1000,
-                    'volume': 1000000 + np.random.randn() * 100000
-                })
-            
-            return data
+            return [
+                {
+                    'timestamp': (now - timedelta(hours=limit-i)).isoformat(),
+                    'open': opens[i],
+                    'high': highs[i],
+                    'low': lows[i],
+                    'close': closes[i],
+                    'volume': volumes[i]
+                }
+                for i in range(limit)
+            ]
             
         except Exception as e:
             logger.error(f"Error fetching market data: {e}")
@@ -277,20 +278,23 @@ def risk(symbol: str):
         logger.error(f"Error in risk endpoint: {e}")
         return jsonify({"error": str(e)}), 500
 
+# Static coin catalog served by /supported-coins
+SUPPORTED_COINS = (
+    {"symbol": "BTC", "name": "Bitcoin"},
+    {"symbol": "ETH", "name": "Ethereum"},
+    {"symbol": "BNB", "name": "Binance Coin"},
+    {"symbol": "ADA", "name": "Cardano"},
+    {"symbol": "SOL", "name": "Solana"},
+    {"symbol": "DOT", "name": "Polkadot"},
+    {"symbol": "MATIC", "name": "Polygon"},
+    {"symbol": "AVAX", "name": "Avalanche"}
+)
+
 @app.route('/supported-coins', methods=['GET'])
 def supported_coins():
     """List supported cryptocurrencies"""
     return jsonify({
-        "coins": [
-            {"symbol": "BTC", "name": "Bitcoin"},
-            {"symbol": "ETH", "name": "Ethereum"},
-            {"symbol": "BNB", "name": "Binance Coin"},
-            {"symbol": "ADA", "name": "Cardano"},
-            {"symbol": "SOL", "name": "Solana"},
-            {"symbol": "DOT", "name": "Polkadot"},
-            {"symbol": "MATIC", "name": "Polygon"},
-            {"symbol": "AVAX", "name": "Avalanche"}
-        ]
+        "coins": SUPPORTED_COINS
     })
 
 if __name__ == '__main__':
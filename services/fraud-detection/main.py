@@ -8,6 +8,7 @@ import numpy as np
 import logging
 from datetime import datetime
 import os
+import math
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,6 +18,12 @@ app = Flask(__name__)
 class FraudDetector:
     """Fraud detection engine"""
     
+    # Fraud pattern rules: (flag, predicate, risk score increment)
+    FRAUD_RULES = (
+        ('large_amount', lambda tx: tx.get('amount', 0) > 10000, 0.2),
+        ('new_account', lambda tx: tx.get('new_account', False), 0.15),
+    )
+    
     def __init__(self):
         self.threshold = float(os.getenv('ALERT_THRESHOLD', 0.75))
         logger.info(f"Fraud detector initialized with threshold={self.threshold}")
@@ -31,13 +38,10 @@ class FraudDetector:
         
         # Check for common fraud patterns
         flags = []
-        if transaction_data.get('amount', 0) > 10000:
-            flags.append('large_amount')
-            risk_score += 0.2
-        
-        if transaction_data.get('new_account', False):
-            flags.append('new_account')
-            risk_score += 0.15
+        for flag, matches, weight in self.FRAUD_RULES:
+            if matches(transaction_data):
+                flags.append(flag)
+                risk_score += weight
         
         risk_score = min(risk_score, 1.0)
         
@@ -51,6 +55,31 @@ class FraudDetector:
 
 detector = FraudDetector()
 
+def parse_transaction(data):
+    """Validate and coerce an /analyze payload once, before any rule runs"""
+    if not isinstance(data, dict):
+        raise ValueError("Transaction payload must be a JSON object")
+    
+    transaction = dict(data)
+    
+    amount = data.get('amount', 0)
+    if isinstance(amount, bool):
+        raise ValueError("amount must be a number")
+    try:
+        transaction['amount'] = float(amount)
+    except (TypeError, ValueError):
+        raise ValueError("amount must be a number")
+    # float() accepts "nan"/"inf", which would slip past every rule threshold
+    if not math.isfinite(transaction['amount']):
+        raise ValueError("amount must be a finite number")
+    
+    new_account = data.get('new_account', False)
+    if not isinstance(new_account, bool):
+        raise ValueError("new_account must be a boolean")
+    transaction['new_account'] = new_account
+    
+    return transaction
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({"status": "healthy", "service": "fraud-detection"})
@@ -58,8 +87,12 @@ def health():
 @app.route('/analyze', methods=['POST'])
 def analyze():
     try:
-        data = request.get_json()
-        result = detector.analyze_transaction(data)
+        transaction = parse_transaction(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
+    try:
+        result = detector.analyze_transaction(transaction)
         return jsonify(result), 200
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
@@ -0,0 +1,32 @@
+"""
+Tests for the fraud-detection /analyze payload validation
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("flask")
+
+# Load this service's main.py under a unique name; every service has one
+_spec = importlib.util.spec_from_file_location(
+    "fraud_detection_main", os.path.join(os.path.dirname(__file__), "main.py")
+)
+fraud_main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fraud_main)
+
+@pytest.fixture
+def client():
+    return fraud_main.app.test_client()
+
+@pytest.mark.parametrize("amount", ["nan", "inf", "-inf"])
+def test_analyze_rejects_non_finite_amount(client, amount):
+    response = client.post('/analyze', json={"amount": amount})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "amount must be a finite number"}
+
+def test_analyze_accepts_numeric_string_amount(client):
+    response = client.post('/analyze', json={"amount": "12000"})
+    assert response.status_code == 200
+    assert 'large_amount' in response.get_json()['flags']
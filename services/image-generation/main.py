@@ -6,12 +6,12 @@ Features: HDR, PBR rendering, personalized styles
 
 from flask import Flask, request, jsonify
 import torch
-import os
 import logging
+import hashlib
+import json
+import itertools
+import time
 from datetime import datetime
-from typing import Optional
-import base64
-from io import BytesIO
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,6 +26,8 @@ class ImageGenerator:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Initializing Image Generator on device: {self.device}")
         self.models = {}
+        # Sequence number keeps IDs unique within the same nanosecond tick
+        self._id_seq = itertools.count(1)
         self.load_models()
     
     def load_models(self):
@@ -71,16 +73,18 @@ class ImageGenerator:
             # - Generate image
             # - Post-process with HDR/PBR
             
+            # One clock read feeds both the ID and the timestamp
+            ns = time.time_ns()
             result = {
                 "status": "success",
-                "image_id": f"img_{datetime.utcnow().timestamp()}",
+                "image_id": f"img_{ns}_{next(self._id_seq)}",
                 "prompt": prompt,
                 "model": model,
                 "style": style,
                 "resolution": resolution,
                 "hdr_enabled": hdr,
                 "pbr_enabled": pbr,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcfromtimestamp(ns / 1e9).isoformat(),
                 "url": f"/outputs/images/placeholder_{model}_{style}.png",
                 "metadata": {
                     "device": self.device,
@@ -134,55 +138,69 @@ def generate():
         logger.error(f"Error in generate endpoint: {e}")
         return jsonify({"error": str(e)}), 500
 
+def catalog_etag(catalog) -> str:
+    """Compute a strong ETag for a static catalog"""
+    return hashlib.sha1(json.dumps(catalog, sort_keys=True).encode()).hexdigest()
+
+# Static model catalog served by /models
+AVAILABLE_MODELS = (
+    {
+        "name": "stable-diffusion",
+        "version": "XL",
+        "description": "Stable Diffusion XL for high-quality image generation",
+        "features": ["HDR", "PBR", "High Resolution"]
+    },
+    {
+        "name": "dall-e",
+        "version": "3",
+        "description": "DALL-E 3 integration for creative image generation",
+        "features": ["Natural Language", "Creative Styles"]
+    },
+    {
+        "name": "stylegan3",
+        "version": "3",
+        "description": "NVIDIA StyleGAN3 for photorealistic generation",
+        "features": ["High Fidelity", "Style Transfer"]
+    },
+    {
+        "name": "dreambooth",
+        "version": "Custom",
+        "description": "DreamBooth fine-tuned models for personalized styles",
+        "features": ["Personalization", "Subject-specific"]
+    }
+)
+
+AVAILABLE_MODELS_ETAG = catalog_etag(AVAILABLE_MODELS)
+
 @app.route('/models', methods=['GET'])
 def list_models():
     """List available models"""
-    return jsonify({
-        "models": [
-            {
-                "name": "stable-diffusion",
-                "version": "XL",
-                "description": "Stable Diffusion XL for high-quality image generation",
-                "features": ["HDR", "PBR", "High Resolution"]
-            },
-            {
-                "name": "dall-e",
-                "version": "3",
-                "description": "DALL-E 3 integration for creative image generation",
-                "features": ["Natural Language", "Creative Styles"]
-            },
-            {
-                "name": "stylegan3",
-                "version": "3",
-                "description": "NVIDIA StyleGAN3 for photorealistic generation",
-                "features": ["High Fidelity", "Style Transfer"]
-            },
-            {
-                "name": "dreambooth",
-                "version": "Custom",
-                "description": "DreamBooth fine-tuned models for personalized styles",
-                "features": ["Personalization", "Subject-specific"]
-            }
-        ]
-    })
+    response = jsonify({"models": AVAILABLE_MODELS})
+    response.set_etag(AVAILABLE_MODELS_ETAG)
+    return response.make_conditional(request)
+
+# Static style catalog served by /styles
+AVAILABLE_STYLES = (
+    "realistic",
+    "artistic",
+    "anime",
+    "cartoon",
+    "oil-painting",
+    "watercolor",
+    "digital-art",
+    "3d-render",
+    "cinematic",
+    "photographic"
+)
+
+AVAILABLE_STYLES_ETAG = catalog_etag(AVAILABLE_STYLES)
 
 @app.route('/styles', methods=['GET'])
 def list_styles():
     """List available artistic styles"""
-    return jsonify({
-        "styles": [
-            "realistic",
-            "artistic",
-            "anime",
-            "cartoon",
-            "oil-painting",
-            "watercolor",
-            "digital-art",
-            "3d-render",
-            "cinematic",
-            "photographic"
-        ]
-    })
+    response = jsonify({"styles": AVAILABLE_STYLES})
+    response.set_etag(AVAILABLE_STYLES_ETAG)
+    return response.make_conditional(request)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)
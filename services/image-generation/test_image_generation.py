@@ -0,0 +1,47 @@
+"""
+Tests for the image-generation catalog ETag handling
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("torch")
+
+# Load this service's main.py under a unique name; every service has one
+_spec = importlib.util.spec_from_file_location(
+    "image_generation_main", os.path.join(os.path.dirname(__file__), "main.py")
+)
+service_main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(service_main)
+
+CATALOGS = [
+    ("/models", service_main.AVAILABLE_MODELS_ETAG),
+    ("/styles", service_main.AVAILABLE_STYLES_ETAG),
+]
+
+@pytest.fixture
+def client():
+    return service_main.app.test_client()
+
+@pytest.mark.parametrize("path,etag", CATALOGS)
+def test_catalog_sets_etag(client, path, etag):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.headers['ETag'] == f'"{etag}"'
+    assert response.get_json()
+
+@pytest.mark.parametrize("path,etag", CATALOGS)
+@pytest.mark.parametrize("header", ['"{}"', 'W/"{}"'])
+def test_catalog_matching_if_none_match_returns_304(client, path, etag, header):
+    response = client.get(path, headers={'If-None-Match': header.format(etag)})
+    assert response.status_code == 304
+    assert response.data == b''
+
+@pytest.mark.parametrize("path,etag", CATALOGS)
+def test_catalog_stale_if_none_match_returns_body(client, path, etag):
+    response = client.get(path, headers={'If-None-Match': '"stale"'})
+    assert response.status_code == 200
+    assert response.get_json()
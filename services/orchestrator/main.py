@@ -22,6 +22,44 @@ app = Flask(__name__)
 class TaskOrchestrator:
     """Main orchestration engine for managing AI tasks"""
     
+    # Priority levels: critical > high > normal > low
+    PRIORITY_MAPPING = {
+        'critical': 4,
+        'high': 3,
+        'normal': 2,
+        'low': 1
+    }
+    
+    # Task type priority multipliers
+    TYPE_PRIORITY = {
+        'fraud_detection': 1.5,  # Security tasks get higher priority
+        'crypto_prediction': 1.2,  # Time-sensitive
+        'image_generation': 1.0,
+        'video_generation': 0.8  # Resource-intensive, lower priority
+    }
+    
+    # Resource requirements per task type (simplified):
+    # (cpu, memory MB, gpu, duration seconds)
+    RESOURCE_REQUIREMENTS = {
+        'image_generation': (2, 4096, 1, 30),
+        'video_generation': (4, 8192, 1, 120),
+        'crypto_prediction': (1, 2048, 0, 10),
+        'fraud_detection': (1, 1024, 0, 5)
+    }
+    NO_REQUIREMENTS = (0, 0, 0, 0)
+    
+    # Composite task types and the subtasks they decompose into
+    DECOMPOSITION_RULES = {
+        'complex_generation': ('image_generation', 'video_generation'),
+        'market_analysis': ('crypto_prediction', 'fraud_detection')
+    }
+    
+    # CPU/memory scaling applied for elevated workflow priorities
+    PRIORITY_RESOURCE_MULTIPLIERS = {
+        'critical': 1.5,
+        'high': 1.2
+    }
+    
     def __init__(self):
         self.redis_host = os.getenv('REDIS_HOST', 'redis-service')
         self.redis_port = int(os.getenv('REDIS_PORT', 6379))
@@ -36,6 +74,17 @@ class TaskOrchestrator:
             'fraud_detection': os.getenv('FRAUD_SERVICE_URL', 'http://fraud-detection-service:5004'),
         }
         
+        # Shared HTTP session so downstream calls reuse pooled connections
+        self.http = requests.Session()
+        
+        # Task type -> executor dispatch table
+        self.task_executors = {
+            'image_generation': self.execute_image_generation,
+            'video_generation': self.execute_video_generation,
+            'crypto_prediction': self.execute_crypto_prediction,
+            'fraud_detection': self.execute_fraud_detection,
+        }
+        
         logger.info("Task Orchestrator initialized successfully")
     
     def connect_redis(self):
@@ -47,9 +96,9 @@ class TaskOrchestrator:
                 decode_responses=True
             )
             self.redis_client.ping()
-            logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
+            logger.info("Connected to Redis at %s:%s", self.redis_host, self.redis_port)
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
             self.redis_client = None
     
     def create_task(self, task_type: str, task_data: Dict[str, Any]):
@@ -61,28 +110,30 @@ class TaskOrchestrator:
             task_data: Task parameters
         """
         task_id = str(uuid4())
+        now = datetime.utcnow().isoformat()
         task = {
             'id': task_id,
             'type': task_type,
             'data': task_data,
             'status': 'pending',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
         
         if self.redis_client:
             try:
-                # Store task in Redis
-                self.redis_client.setex(
+                # Store and enqueue the task in one round trip (MULTI/EXEC)
+                pipe = self.redis_client.pipeline()
+                pipe.setex(
                     f"task:{task_id}",
                     3600,  # 1 hour TTL
                     json.dumps(task)
                 )
-                # Add to queue
-                self.redis_client.rpush(f"queue:{task_type}", task_id)
-                logger.info(f"Created task {task_id} of type {task_type}")
+                pipe.rpush(f"queue:{task_type}", task_id)
+                pipe.execute()
+                logger.info("Created task %s of type %s", task_id, task_type)
             except Exception as e:
-                logger.error(f"Error creating task: {e}")
+                logger.error("Error creating task: %s", e)
         
         return task
     
@@ -97,7 +148,7 @@ class TaskOrchestrator:
         """
         try:
             workflow_id = str(uuid4())
-            logger.info(f"Orchestrating workflow {workflow_id} with {len(tasks)} tasks, priority: {priority}")
+            logger.info("Orchestrating workflow %s with %s tasks, priority: %s", workflow_id, len(tasks), priority)
             
             # Decompose and prioritize tasks
             decomposed_tasks = self._decompose_tasks(tasks)
@@ -113,17 +164,12 @@ class TaskOrchestrator:
                 task_params = task.get('params', {})
                 task_priority = task.get('priority', priority)
                 
-                logger.info(f"Executing task {task_type} with priority {task_priority}")
+                logger.info("Executing task %s with priority %s", task_type, task_priority)
                 
                 # Create and execute task
-                if task_type == 'image_generation':
-                    result = self.execute_image_generation(task_params)
-                elif task_type == 'video_generation':
-                    result = self.execute_video_generation(task_params)
-                elif task_type == 'crypto_prediction':
-                    result = self.execute_crypto_prediction(task_params)
-                elif task_type == 'fraud_detection':
-                    result = self.execute_fraud_detection(task_params)
+                executor = self.task_executors.get(task_type)
+                if executor is not None:
+                    result = executor(task_params)
                 else:
                     result = {'error': f'Unknown task type: {task_type}'}
                 
@@ -152,12 +198,12 @@ class TaskOrchestrator:
                         json.dumps(workflow_result)
                     )
                 except Exception as e:
-                    logger.error(f"Error storing workflow result: {e}")
+                    logger.error("Error storing workflow result: %s", e)
             
             return workflow_result
             
         except Exception as e:
-            logger.error(f"Workflow orchestration failed: {e}")
+            logger.error("Workflow orchestration failed: %s", e)
             raise
     
     def _decompose_tasks(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -165,41 +211,33 @@ class TaskOrchestrator:
         Decompose complex tasks into simpler subtasks
         L19 layer task decomposition
         """
+        rules = self.DECOMPOSITION_RULES
+        
+        # Common case: every task is already a leaf task, so the input list
+        # can be used as-is instead of being rebuilt
+        if not any(task.get('type') in rules for task in tasks):
+            return tasks
+        
         decomposed = []
         
         for task in tasks:
             task_type = task.get('type')
+            subtask_types = rules.get(task_type)
             
-            # Check if task needs decomposition
-            if task_type == 'complex_generation':
-                # Decompose into image + video generation
-                decomposed.append({
-                    'type': 'image_generation',
-                    'params': task.get('params', {}),
-                    'parent_task': task_type
-                })
-                decomposed.append({
-                    'type': 'video_generation',
-                    'params': task.get('params', {}),
-                    'parent_task': task_type
-                })
-            elif task_type == 'market_analysis':
-                # Decompose into prediction + fraud detection
-                decomposed.append({
-                    'type': 'crypto_prediction',
-                    'params': task.get('params', {}),
-                    'parent_task': task_type
-                })
+            if subtask_types is None:
+                # No decomposition needed
+                decomposed.append(task)
+                continue
+            
+            params = task.get('params', {})
+            for subtask_type in subtask_types:
                 decomposed.append({
-                    'type': 'fraud_detection',
-                    'params': task.get('params', {}),
+                    'type': subtask_type,
+                    'params': params,
                     'parent_task': task_type
                 })
-            else:
-                # No decomposition needed
-                decomposed.append(task)
         
-        logger.info(f"Task decomposition: {len(tasks)} → {len(decomposed)} tasks")
+        logger.info("Task decomposition: %s → %s tasks", len(tasks), len(decomposed))
         return decomposed
     
     def _prioritize_tasks(self, tasks: List[Dict[str, Any]], workflow_priority: str) -> List[Dict[str, Any]]:
@@ -207,22 +245,8 @@ class TaskOrchestrator:
         Prioritize tasks based on type and workflow priority
         Priority levels: critical > high > normal > low
         """
-        priority_mapping = {
-            'critical': 4,
-            'high': 3,
-            'normal': 2,
-            'low': 1
-        }
-        
-        # Task type priority multipliers
-        type_priority = {
-            'fraud_detection': 1.5,  # Security tasks get higher priority
-            'crypto_prediction': 1.2,  # Time-sensitive
-            'image_generation': 1.0,
-            'video_generation': 0.8  # Resource-intensive, lower priority
-        }
-        
-        base_priority = priority_mapping.get(workflow_priority, 2)
+        base_priority = self.PRIORITY_MAPPING.get(workflow_priority, 2)
+        type_priority = self.TYPE_PRIORITY
         
         for task in tasks:
             task_type = task.get('type')
@@ -230,56 +254,55 @@ class TaskOrchestrator:
             task['priority_score'] = base_priority * type_mult
             task['priority'] = workflow_priority
         
-        # Sort by priority score (highest first)
-        prioritized = sorted(tasks, key=lambda x: x.get('priority_score', 0), reverse=True)
+        # Sort by priority score (highest first); every task was just scored
+        tasks.sort(key=lambda x: x['priority_score'], reverse=True)
         
-        logger.info(f"Tasks prioritized: {[f\"{t['type']}({t['priority_score']:.1f})\" for t in prioritized]}")
-        return prioritized
+        # The summary list is only worth building if it will be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Tasks prioritized: %s",
+                [f"{t.get('type')}({t['priority_score']:.1f})" for t in tasks]
+            )
+        return tasks
     
     def _allocate_resources(self, tasks: List[Dict[str, Any]], priority: str) -> Dict[str, Any]:
         """
         Allocate resources based on task requirements and priority
         Returns resource allocation plan
         """
-        allocation = {
-            'cpu': 0,
-            'memory': 0,
-            'gpu': 0,
-            'estimated_duration': 0
-        }
-        
-        # Resource requirements per task type (simplified)
-        resource_requirements = {
-            'image_generation': {'cpu': 2, 'memory': 4096, 'gpu': 1, 'duration': 30},
-            'video_generation': {'cpu': 4, 'memory': 8192, 'gpu': 1, 'duration': 120},
-            'crypto_prediction': {'cpu': 1, 'memory': 2048, 'gpu': 0, 'duration': 10},
-            'fraud_detection': {'cpu': 1, 'memory': 1024, 'gpu': 0, 'duration': 5}
-        }
+        requirements_table = self.RESOURCE_REQUIREMENTS
+        no_requirements = self.NO_REQUIREMENTS
+        cpu = memory = gpu = duration = 0
         
         for task in tasks:
-            task_type = task.get('type')
-            requirements = resource_requirements.get(task_type, {})
-            
-            allocation['cpu'] = max(allocation['cpu'], requirements.get('cpu', 0))
-            allocation['memory'] += requirements.get('memory', 0)
-            allocation['gpu'] = max(allocation['gpu'], requirements.get('gpu', 0))
-            allocation['estimated_duration'] += requirements.get('duration', 0)
+            task_cpu, task_memory, task_gpu, task_duration = requirements_table.get(
+                task.get('type'), no_requirements
+            )
+            cpu = max(cpu, task_cpu)
+            memory += task_memory
+            gpu = max(gpu, task_gpu)
+            duration += task_duration
         
         # Apply priority modifiers
-        if priority == 'critical':
-            allocation['cpu'] = int(allocation['cpu'] * 1.5)
-            allocation['memory'] = int(allocation['memory'] * 1.5)
-        elif priority == 'high':
-            allocation['cpu'] = int(allocation['cpu'] * 1.2)
-            allocation['memory'] = int(allocation['memory'] * 1.2)
+        multiplier = self.PRIORITY_RESOURCE_MULTIPLIERS.get(priority)
+        if multiplier is not None:
+            cpu = int(cpu * multiplier)
+            memory = int(memory * multiplier)
         
-        logger.info(f"Resource allocation: CPU={allocation['cpu']}, Memory={allocation['memory']}MB, GPU={allocation['gpu']}")
+        allocation = {
+            'cpu': cpu,
+            'memory': memory,
+            'gpu': gpu,
+            'estimated_duration': duration
+        }
+        
+        logger.info("Resource allocation: CPU=%s, Memory=%sMB, GPU=%s", allocation['cpu'], allocation['memory'], allocation['gpu'])
         return allocation
     
     def execute_image_generation(self, params: Dict[str, Any]):
         """Execute image generation task"""
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.services['image_generation']}/generate",
                 json=params,
                 timeout=300
@@ -287,13 +310,13 @@ class TaskOrchestrator:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Image generation task failed: {e}")
+            logger.error("Image generation task failed: %s", e)
             return {'error': str(e)}
     
     def execute_video_generation(self, params: Dict[str, Any]):
         """Execute video generation task"""
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.services['video_generation']}/generate",
                 json=params,
                 timeout=600
@@ -301,13 +324,13 @@ class TaskOrchestrator:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Video generation task failed: {e}")
+            logger.error("Video generation task failed: %s", e)
             return {'error': str(e)}
     
     def execute_crypto_prediction(self, params: Dict[str, Any]):
         """Execute crypto prediction task"""
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.services['crypto_prediction']}/predict",
                 json=params,
                 timeout=60
@@ -315,13 +338,13 @@ class TaskOrchestrator:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Crypto prediction task failed: {e}")
+            logger.error("Crypto prediction task failed: %s", e)
             return {'error': str(e)}
     
     def execute_fraud_detection(self, params: Dict[str, Any]):
         """Execute fraud detection task"""
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.services['fraud_detection']}/analyze",
                 json=params,
                 timeout=30
@@ -329,7 +352,7 @@ class TaskOrchestrator:
             response.raise_for_status()
             return response.json()
         except Exception as e:
-            logger.error(f"Fraud detection task failed: {e}")
+            logger.error("Fraud detection task failed: %s", e)
             return {'error': str(e)}
     
     def get_task_status(self, task_id: str):
@@ -340,12 +363,28 @@ class TaskOrchestrator:
                 if task_data:
                     return json.loads(task_data)
             except Exception as e:
-                logger.error(f"Error retrieving task status: {e}")
+                logger.error("Error retrieving task status: %s", e)
         return None
+    
+    def get_task_statuses(self, task_ids: List[str]) -> Dict[str, Any]:
+        """Get status of several tasks in a single Redis round trip"""
+        statuses = dict.fromkeys(task_ids)
+        if self.redis_client and task_ids:
+            try:
+                task_data = self.redis_client.mget([f"task:{task_id}" for task_id in task_ids])
+                for task_id, data in zip(task_ids, task_data):
+                    if data:
+                        statuses[task_id] = json.loads(data)
+            except Exception as e:
+                logger.error("Error retrieving task statuses: %s", e)
+        return statuses
 
 # Initialize orchestrator
 orchestrator = TaskOrchestrator()
 
+# Upper bound on task IDs accepted by the batch status endpoint
+MAX_BATCH_TASKS = 100
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -374,7 +413,7 @@ def orchestrate():
         return jsonify(result), 200
         
     except Exception as e:
-        logger.error(f"Error in orchestrate endpoint: {e}")
+        logger.error("Error in orchestrate endpoint: %s", e)
         return jsonify({"error": str(e)}), 500
 
 @app.route('/task/<task_id>', methods=['GET'])
@@ -387,7 +426,25 @@ def get_task(task_id: str):
         else:
             return jsonify({"error": "Task not found"}), 404
     except Exception as e:
-        logger.error(f"Error retrieving task: {e}")
+        logger.error("Error retrieving task: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/tasks/batch', methods=['POST'])
+def get_tasks_batch():
+    """Get status of up to MAX_BATCH_TASKS tasks by ID"""
+    try:
+        data = request.get_json(silent=True)
+        task_ids = data.get('task_ids') if isinstance(data, dict) else None
+        
+        if not isinstance(task_ids, list) or not all(isinstance(t, str) for t in task_ids):
+            return jsonify({"error": "task_ids list of strings is required"}), 400
+        
+        if len(task_ids) > MAX_BATCH_TASKS:
+            return jsonify({"error": f"At most {MAX_BATCH_TASKS} task_ids per request"}), 400
+        
+        return jsonify({"tasks": orchestrator.get_task_statuses(task_ids)}), 200
+    except Exception as e:
+        logger.error("Error retrieving tasks: %s", e)
         return jsonify({"error": str(e)}), 500
 
 @app.route('/services', methods=['GET'])
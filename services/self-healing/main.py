@@ -5,14 +5,15 @@ Health monitoring, failure detection, and auto-repair
 
 from flask import Flask, request, jsonify
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 import requests
 import os
-import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
+from collections import defaultdict, deque
 import time
-from threading import Thread
+from threading import Thread, Lock
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -39,8 +40,12 @@ class SelfHealingMonitor:
         }
         
         self.health_checks = {}
-        self.failure_counts = {}
-        self.repair_history = []
+        self.healthy_services = set()
+        self._health_lock = Lock()  # Guards health_checks/healthy_services
+        self._health_version = 0  # Bumped on every health_checks write
+        self._summary_cache = None  # (health version, summary without timestamp)
+        self.failure_counts = defaultdict(int)
+        self.repair_history = deque(maxlen=100)  # Keep only last 100 repair attempts
         self.monitoring_enabled = True
         
         # Configuration
@@ -48,6 +53,12 @@ class SelfHealingMonitor:
         self.failure_threshold = int(os.getenv('FAILURE_THRESHOLD', 3))
         self.repair_timeout = int(os.getenv('REPAIR_TIMEOUT', 300))  # seconds
         
+        # Reused pool for probing services in parallel
+        self.check_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('HEALTH_CHECK_WORKERS', 8)),
+            thread_name_prefix='health-check'
+        )
+        
         # Start monitoring thread
         self.monitor_thread = Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -56,13 +67,23 @@ class SelfHealingMonitor:
     
     def _monitor_loop(self):
         """Continuous monitoring loop"""
+        # Sweeps run on a fixed cadence measured from a monotonic deadline,
+        # so the period does not stretch by however long each sweep takes
+        next_check = time.monotonic()
         while self.monitoring_enabled:
             try:
                 self.check_all_services()
-                time.sleep(self.check_interval)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.check_interval)
+            
+            next_check += self.check_interval
+            delay = next_check - time.monotonic()
+            if delay < 0:
+                # Behind schedule: skip the missed sweeps rather than bunching them up
+                logger.warning(f"Health sweep overran check interval by {-delay:.1f}s")
+                next_check = time.monotonic()
+                delay = 0
+            time.sleep(delay)
     
     def check_service_health(self, service_name: str, service_config: Dict) -> Dict[str, Any]:
         """Check health of a single service"""
@@ -75,12 +96,12 @@ class SelfHealingMonitor:
         }
         
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             response = requests.get(
                 f"{service_config['url']}/health",
                 timeout=10
             )
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             if response.status_code == 200:
                 health_status['status'] = 'healthy'
@@ -108,29 +129,36 @@ class SelfHealingMonitor:
             health_status['error'] = str(e)
             self._increment_failure(service_name)
         
-        self.health_checks[service_name] = health_status
+        with self._health_lock:
+            self.health_checks[service_name] = health_status
+            if health_status['status'] == 'healthy':
+                self.healthy_services.add(service_name)
+            else:
+                self.healthy_services.discard(service_name)
+            self._health_version += 1
         return health_status
     
     def _increment_failure(self, service_name: str):
         """Increment failure count and trigger repair if threshold exceeded"""
-        if service_name not in self.failure_counts:
-            self.failure_counts[service_name] = 0
-        
         self.failure_counts[service_name] += 1
+        failures = self.failure_counts[service_name]
         
-        if self.failure_counts[service_name] >= self.failure_threshold:
+        if failures >= self.failure_threshold:
             logger.warning(
-                f"Service {service_name} has failed {self.failure_counts[service_name]} times. "
+                f"Service {service_name} has failed {failures} times. "
                 f"Triggering auto-repair..."
             )
             self.attempt_repair(service_name)
     
     def check_all_services(self) -> Dict[str, Dict]:
         """Check health of all services"""
-        results = {}
-        for service_name, service_config in self.services.items():
-            results[service_name] = self.check_service_health(service_name, service_config)
-        return results
+        futures = {
+            service_name: self.check_executor.submit(
+                self.check_service_health, service_name, service_config
+            )
+            for service_name, service_config in self.services.items()
+        }
+        return {service_name: future.result() for service_name, future in futures.items()}
     
     def attempt_repair(self, service_name: str) -> Dict[str, Any]:
         """
@@ -185,10 +213,6 @@ class SelfHealingMonitor:
         # Store repair history
         self.repair_history.append(repair_result)
         
-        # Keep only last 100 repair attempts
-        if len(self.repair_history) > 100:
-            self.repair_history = self.repair_history[-100:]
-        
         return repair_result
     
     def _restart_service_container(self, service_name: str) -> bool:
@@ -227,20 +251,22 @@ class SelfHealingMonitor:
     
     def get_system_health_summary(self) -> Dict[str, Any]:
         """Get overall system health summary"""
-        total_services = len(self.services)
-        healthy_services = sum(
-            1 for status in self.health_checks.values() 
-            if status.get('status') == 'healthy'
-        )
+        # Rebuild the aggregate only when a health check has landed since the
+        # last call; polls between monitor sweeps reuse the cached body
+        with self._health_lock:
+            if self._summary_cache is None or self._summary_cache[0] != self._health_version:
+                total_services = len(self.services)
+                healthy_services = len(self.healthy_services)
+                self._summary_cache = (self._health_version, {
+                    'total_services': total_services,
+                    'healthy_services': healthy_services,
+                    'unhealthy_services': total_services - healthy_services,
+                    'overall_health': 'healthy' if healthy_services == total_services else 'degraded',
+                    'services': dict(self.health_checks)
+                })
+            summary = self._summary_cache[1]
         
-        return {
-            'total_services': total_services,
-            'healthy_services': healthy_services,
-            'unhealthy_services': total_services - healthy_services,
-            'overall_health': 'healthy' if healthy_services == total_services else 'degraded',
-            'timestamp': datetime.utcnow().isoformat(),
-            'services': self.health_checks
-        }
+        return {**summary, 'timestamp': datetime.utcnow().isoformat()}
     
     def propose_fixes(self, service_name: str) -> List[Dict[str, Any]]:
         """
@@ -353,7 +379,7 @@ def get_repair_history():
     """Get repair history"""
     limit = request.args.get('limit', 50, type=int)
     return jsonify({
-        'repairs': monitor.repair_history[-limit:],
+        'repairs': list(monitor.repair_history)[-limit:],
         'total': len(monitor.repair_history)
     })
 
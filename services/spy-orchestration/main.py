@@ -6,16 +6,18 @@ Automated scouting for AI models, open-source tech, and research papers
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import httpx
 import hashlib
 import json
 import os
+import xml.etree.ElementTree as ET
 import asyncpg
 from uuid import uuid4
 from contextlib import asynccontextmanager
+from bisect import bisect_left
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -43,7 +45,7 @@ async def lifespan(app: FastAPI):
         logger.info("Database connection pool created")
         await init_database()
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
     
     yield
     
@@ -135,42 +137,64 @@ async def init_database():
             CREATE INDEX IF NOT EXISTS idx_content_hash ON spy_discoveries(content_hash)
         ''')
         
+        # Indexes matching the /discoveries listing order and the stats window
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_discoveries_type_relevance
+            ON spy_discoveries(scan_type, relevance_score DESC, discovered_at DESC)
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_discoveries_relevance
+            ON spy_discoveries(relevance_score DESC, discovered_at DESC)
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_discoveries_discovered_at
+            ON spy_discoveries(discovered_at)
+        ''')
+        
         logger.info("Spy-orchestration database tables initialized")
 
-async def store_discovery(discovery: DiscoveryResult, scan_id: str) -> bool:
+async def store_discoveries(discoveries: List[DiscoveryResult], scan_id: str) -> Set[str]:
     """
-    Store discovery with deduplication
-    Returns True if stored (new), False if duplicate
+    Store a scan's discoveries with deduplication in a single round trip
+    Returns the result_ids that were stored (new); duplicates are skipped
     """
-    if not db_pool:
-        return False
+    if not db_pool or not discoveries:
+        return set()
     
-    # Generate content hash for deduplication
-    content = f"{discovery.title}|{discovery.url}".encode()
-    content_hash = hashlib.sha256(content).hexdigest()
+    # Generate content hashes for deduplication
+    content_hashes = [
+        hashlib.sha256(f"{d.title}|{d.url}".encode()).hexdigest()
+        for d in discoveries
+    ]
     
     try:
         async with db_pool.acquire() as conn:
-            await conn.execute('''
+            # One INSERT over parallel arrays; RETURNING lists only rows that
+            # the conflict clause did not skip
+            rows = await conn.fetch('''
                 INSERT INTO spy_discoveries 
                 (result_id, scan_id, scan_type, title, description, url, content_hash, 
                  relevance_score, metadata, discovered_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                SELECT result_id, $2, scan_type, title, description, url, content_hash,
+                       relevance_score, metadata::jsonb, discovered_at::timestamp
+                FROM unnest($1::text[], $3::text[], $4::text[], $5::text[], $6::text[],
+                            $7::text[], $8::float8[], $9::text[], $10::text[])
+                    AS d(result_id, scan_type, title, description, url, content_hash,
+                         relevance_score, metadata, discovered_at)
                 ON CONFLICT (content_hash) DO NOTHING
-            ''', discovery.result_id, scan_id, discovery.scan_type, discovery.title,
-            discovery.description, discovery.url, content_hash, discovery.relevance_score,
-            json.dumps(discovery.metadata), discovery.discovered_at)
+                RETURNING result_id
+            ''', [d.result_id for d in discoveries], scan_id,
+            [d.scan_type for d in discoveries], [d.title for d in discoveries],
+            [d.description for d in discoveries], [d.url for d in discoveries],
+            content_hashes, [d.relevance_score for d in discoveries],
+            [json.dumps(d.metadata) for d in discoveries],
+            [d.discovered_at for d in discoveries])
             
-            # Check if actually inserted
-            result = await conn.fetchval(
-                'SELECT COUNT(*) FROM spy_discoveries WHERE content_hash = $1',
-                content_hash
-            )
-            return result == 1
+            return {row['result_id'] for row in rows}
     
     except Exception as e:
-        logger.error(f"Error storing discovery: {e}")
-        return False
+        logger.error("Error storing discoveries: %s", e)
+        return set()
 
 async def update_scan_status(scan_id: str, status: str, results_count: int = 0, 
                              error: Optional[str] = None):
@@ -197,12 +221,15 @@ async def scan_github(scan_id: str, parameters: Dict[str, Any]) -> List[Discover
     """
     Scan GitHub for relevant repositories
     """
-    logger.info(f"Starting GitHub scan: {scan_id}")
+    logger.info("Starting GitHub scan: %s", scan_id)
     
     query = parameters.get('query', 'AI machine learning stars:>100')
     max_results = parameters.get('max_results', 50)
+    min_relevance = parameters.get('min_relevance', 0.3)
     
     discoveries = []
+    now = datetime.now(timezone.utc)
+    discovered_at = now.replace(tzinfo=None).isoformat()
     
     headers = {}
     if GITHUB_TOKEN:
@@ -227,10 +254,9 @@ async def scan_github(scan_id: str, parameters: Dict[str, Any]) -> List[Discover
             
             for repo in data.get('items', []):
                 # Calculate relevance score
-                relevance_score = calculate_repo_relevance(repo, parameters)
+                relevance_score = calculate_repo_relevance(repo, parameters, now)
                 
                 # Filter by minimum relevance
-                min_relevance = parameters.get('min_relevance', 0.3)
                 if relevance_score < min_relevance:
                     continue
                 
@@ -249,44 +275,47 @@ async def scan_github(scan_id: str, parameters: Dict[str, Any]) -> List[Discover
                         'updated_at': repo['updated_at'],
                         'license': repo.get('license', {}).get('name') if repo.get('license') else None
                     },
-                    discovered_at=datetime.utcnow().isoformat()
+                    discovered_at=discovered_at
                 )
                 
                 discoveries.append(discovery)
-                
-                # Store in database
-                is_new = await store_discovery(discovery, scan_id)
-                if is_new:
-                    logger.info(f"New repository discovered: {repo['full_name']}")
-                else:
-                    logger.debug(f"Duplicate repository skipped: {repo['full_name']}")
+            
+            # Store in database
+            new_ids = await store_discoveries(discoveries, scan_id)
+            # Skip the per-discovery walk entirely when nothing would be emitted
+            if logger.isEnabledFor(logging.INFO):
+                for discovery in discoveries:
+                    if discovery.result_id in new_ids:
+                        logger.info("New repository discovered: %s", discovery.title)
+                    else:
+                        logger.debug("Duplicate repository skipped: %s", discovery.title)
     
     except Exception as e:
-        logger.error(f"Error scanning GitHub: {e}")
+        logger.error("Error scanning GitHub: %s", e)
         raise
     
     return discoveries
 
-def calculate_repo_relevance(repo: Dict, parameters: Dict) -> float:
+# Star count tiers: more than 100/1000/10000 stars earns 0.1/0.2/0.3
+STAR_TIER_THRESHOLDS = (100, 1000, 10000)
+STAR_TIER_SCORES = (0.0, 0.1, 0.2, 0.3)
+
+def calculate_repo_relevance(repo: Dict, parameters: Dict,
+                             now: Optional[datetime] = None) -> float:
     """
     Calculate relevance score for a GitHub repository
     Based on stars, recency, topics, and keywords
+    Pass an aware UTC `now` to share one clock reading across a scan
     """
     score = 0.0
     
     # Stars contribution (0-0.3)
-    stars = repo['stargazers_count']
-    if stars > 10000:
-        score += 0.3
-    elif stars > 1000:
-        score += 0.2
-    elif stars > 100:
-        score += 0.1
+    score += STAR_TIER_SCORES[bisect_left(STAR_TIER_THRESHOLDS, repo['stargazers_count'])]
     
     # Recency contribution (0-0.2)
     try:
         updated_at = datetime.fromisoformat(repo['updated_at'].replace('Z', '+00:00'))
-        days_since_update = (datetime.utcnow().replace(tzinfo=updated_at.tzinfo) - updated_at).days
+        days_since_update = ((now or datetime.now(timezone.utc)) - updated_at).days
         if days_since_update < 30:
             score += 0.2
         elif days_since_update < 180:
@@ -314,13 +343,15 @@ async def scan_research(scan_id: str, parameters: Dict[str, Any]) -> List[Discov
     """
     Scan arXiv and other sources for research papers
     """
-    logger.info(f"Starting research scan: {scan_id}")
+    logger.info("Starting research scan: %s", scan_id)
     
     query = parameters.get('query', 'artificial intelligence')
     max_results = parameters.get('max_results', 50)
     category = parameters.get('category', 'cs.AI')  # Computer Science - AI
+    min_relevance = parameters.get('min_relevance', 0.3)
     
     discoveries = []
+    discovered_at = datetime.utcnow().isoformat()
     
     try:
         async with httpx.AsyncClient() as client:
@@ -339,7 +370,6 @@ async def scan_research(scan_id: str, parameters: Dict[str, Any]) -> List[Discov
             response.raise_for_status()
             
             # Parse XML response (simple parsing)
-            import xml.etree.ElementTree as ET
             root = ET.fromstring(response.text)
             
             # Namespace for arXiv
@@ -371,7 +401,6 @@ async def scan_research(scan_id: str, parameters: Dict[str, Any]) -> List[Discov
                 relevance_score = calculate_paper_relevance(title, summary, parameters)
                 
                 # Filter by minimum relevance
-                min_relevance = parameters.get('min_relevance', 0.3)
                 if relevance_score < min_relevance:
                     continue
                 
@@ -387,18 +416,20 @@ async def scan_research(scan_id: str, parameters: Dict[str, Any]) -> List[Discov
                         'published': published,
                         'category': category
                     },
-                    discovered_at=datetime.utcnow().isoformat()
+                    discovered_at=discovered_at
                 )
                 
                 discoveries.append(discovery)
-                
-                # Store in database
-                is_new = await store_discovery(discovery, scan_id)
-                if is_new:
-                    logger.info(f"New paper discovered: {title[:50]}...")
+            
+            # Store in database
+            new_ids = await store_discoveries(discoveries, scan_id)
+            if logger.isEnabledFor(logging.INFO):
+                for discovery in discoveries:
+                    if discovery.result_id in new_ids:
+                        logger.info("New paper discovered: %s...", discovery.title[:50])
     
     except Exception as e:
-        logger.error(f"Error scanning research papers: {e}")
+        logger.error("Error scanning research papers: %s", e)
         raise
     
     return discoveries
@@ -407,15 +438,16 @@ def calculate_paper_relevance(title: str, summary: str, parameters: Dict) -> flo
     """Calculate relevance score for a research paper"""
     score = 0.0
     
-    combined_text = f"{title} {summary}".lower()
+    title_lower = title.lower()
+    combined_text = f"{title_lower} {summary.lower()}"
     
     # Keywords matching (0-0.5)
-    keywords = parameters.get('keywords', ['neural', 'learning', 'ai', 'model'])
-    matches = sum(1 for kw in keywords if kw.lower() in combined_text)
+    keywords = [kw.lower() for kw in parameters.get('keywords', ['neural', 'learning', 'ai', 'model'])]
+    matches = sum(1 for kw in keywords if kw in combined_text)
     score += min(0.5, matches * 0.15)
     
     # Title relevance (0-0.3)
-    if any(kw.lower() in title.lower() for kw in keywords):
+    if any(kw in title_lower for kw in keywords):
         score += 0.3
     
     # Base relevance (0.2)
@@ -429,12 +461,13 @@ async def scan_blogs(scan_id: str, parameters: Dict[str, Any]) -> List[Discovery
     Scan technology blogs and news sources
     Simulated implementation - can be extended to scrape actual blogs
     """
-    logger.info(f"Starting blog scan: {scan_id}")
+    logger.info("Starting blog scan: %s", scan_id)
     
     # This is a simplified implementation
     # In production, integrate with RSS feeds, APIs, or web scraping
     
     discoveries = []
+    discovered_at = datetime.utcnow().isoformat()
     
     # Example: Known AI/ML blog sources
     blog_sources = [
@@ -467,34 +500,38 @@ async def scan_blogs(scan_id: str, parameters: Dict[str, Any]) -> List[Discovery
                 'topics': source['topics'],
                 'source_type': 'blog'
             },
-            discovered_at=datetime.utcnow().isoformat()
+            discovered_at=discovered_at
         )
         
         discoveries.append(discovery)
-        await store_discovery(discovery, scan_id)
+    
+    await store_discoveries(discoveries, scan_id)
     
     return discoveries
 
+# Scan type -> scanner dispatch table
+SCAN_HANDLERS = {
+    'github': scan_github,
+    'research': scan_research,
+    'blog': scan_blogs,
+}
+
 # Background task for scanning
 async def perform_scan(scan_id: str, scan_type: str, parameters: Dict[str, Any]):
     """Perform scan in background"""
     try:
         await update_scan_status(scan_id, 'running')
         
-        if scan_type == 'github':
-            results = await scan_github(scan_id, parameters)
-        elif scan_type == 'research':
-            results = await scan_research(scan_id, parameters)
-        elif scan_type == 'blog':
-            results = await scan_blogs(scan_id, parameters)
-        else:
+        handler = SCAN_HANDLERS.get(scan_type)
+        if handler is None:
             raise ValueError(f"Unknown scan type: {scan_type}")
+        results = await handler(scan_id, parameters)
         
         await update_scan_status(scan_id, 'completed', results_count=len(results))
-        logger.info(f"Scan {scan_id} completed with {len(results)} results")
+        logger.info("Scan %s completed with %s results", scan_id, len(results))
         
     except Exception as e:
-        logger.error(f"Scan {scan_id} failed: {e}")
+        logger.error("Scan %s failed: %s", scan_id, e)
         await update_scan_status(scan_id, 'failed', error=str(e))
 
 # API Endpoints
@@ -536,7 +573,7 @@ async def start_scan(request: ScanRequest, background_tasks: BackgroundTasks) ->
         )
     
     except Exception as e:
-        logger.error(f"Error starting scan: {e}")
+        logger.error("Error starting scan: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/scan/{scan_id}")
@@ -567,7 +604,7 @@ async def get_scan_status(scan_id: str) -> ScanStatus:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting scan status: {e}")
+        logger.error("Error getting scan status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/discoveries")
@@ -611,7 +648,7 @@ async def list_discoveries(scan_type: Optional[str] = None,
             return results
     
     except Exception as e:
-        logger.error(f"Error listing discoveries: {e}")
+        logger.error("Error listing discoveries: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/stats")
@@ -643,7 +680,7 @@ async def get_stats() -> Dict[str, Any]:
             }
     
     except Exception as e:
-        logger.error(f"Error getting stats: {e}")
+        logger.error("Error getting stats: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
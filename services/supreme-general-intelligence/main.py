@@ -6,12 +6,14 @@ Primary chat interface with intent understanding, action confirmation, and loggi
 from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 from datetime import datetime
 import json
 import os
-import hashlib
+import hmac
+import re
+import httpx
 from uuid import uuid4
 import asyncpg
 from contextlib import asynccontextmanager
@@ -32,16 +34,20 @@ if not OWNER_SECRET or OWNER_SECRET == 'your_secure_owner_secret_key':
     logger.error("OWNER_SECRET not configured! Set a secure value in environment variables.")
     raise ValueError("OWNER_SECRET must be set to a secure value. Please configure it in .env file.")
 
-OWNER_SECRET_HASH = hashlib.sha256(OWNER_SECRET.encode()).hexdigest()
+OWNER_SECRET_BYTES = OWNER_SECRET.encode()
 
 # Database connection pool
 db_pool = None
 
+# Shared HTTP client for downstream service calls (keeps connections alive)
+http_client = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
-    global db_pool
+    global db_pool, http_client
     # Startup
+    http_client = httpx.AsyncClient()
     try:
         db_pool = await asyncpg.create_pool(DATABASE_URL, min_size=1, max_size=10)
         logger.info("Database connection pool created")
@@ -52,6 +58,7 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    await http_client.aclose()
     if db_pool:
         await db_pool.close()
         logger.info("Database connection pool closed")
@@ -115,8 +122,7 @@ class LogEntry(BaseModel):
 # Authentication
 async def verify_owner(x_owner_secret: str = Header(...)):
     """Verify owner-only access"""
-    secret_hash = hashlib.sha256(x_owner_secret.encode()).hexdigest()
-    if secret_hash != OWNER_SECRET_HASH:
+    if not hmac.compare_digest(x_owner_secret.encode(), OWNER_SECRET_BYTES):
         raise HTTPException(status_code=403, detail="Unauthorized: Owner access required")
     return True
 
@@ -164,6 +170,20 @@ async def init_database():
             )
         ''')
         
+        # Indexes for per-action log lookups and the /actions listing
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sgi_logs_action
+            ON sgi_logs(action_id, timestamp)
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sgi_actions_status_created
+            ON sgi_actions(status, created_at DESC)
+        ''')
+        await conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sgi_actions_created
+            ON sgi_actions(created_at DESC)
+        ''')
+        
         logger.info("Database tables initialized")
 
 async def store_action(action_id: str, intent: Intent, summary: str):
@@ -218,53 +238,90 @@ async def get_action_logs(action_id: str) -> List[Dict]:
         
         return [dict(row) for row in rows]
 
-# Intent understanding
-def analyze_intent(message: str) -> Intent:
-    """
-    Analyze user message to understand intent
-    Uses keyword matching and pattern recognition
-    """
-    message_lower = message.lower()
-    
-    # Action keywords
-    action_keywords = {
-        'generate': ['generate', 'create', 'make', 'produce'],
-        'predict': ['predict', 'forecast', 'estimate'],
-        'analyze': ['analyze', 'examine', 'inspect', 'check'],
-        'scan': ['scan', 'search', 'find', 'discover', 'scout'],
-        'deploy': ['deploy', 'launch', 'start', 'run'],
-        'monitor': ['monitor', 'watch', 'track'],
-        'repair': ['repair', 'fix', 'heal', 'restore']
-    }
-    
-    # Entity keywords
-    entity_keywords = {
-        'image': ['image', 'picture', 'photo', 'visual'],
-        'video': ['video', 'movie', 'clip', 'animation'],
-        'crypto': ['crypto', 'bitcoin', 'ethereum', 'btc', 'eth', 'cryptocurrency'],
-        'github': ['github', 'repository', 'repo', 'code'],
-        'research': ['research', 'paper', 'arxiv', 'study'],
-        'fraud': ['fraud', 'security', 'threat', 'anomaly']
-    }
+async def get_action_log_messages(action_id: str) -> List[str]:
+    """Retrieve only the log messages for a specific action"""
+    if not db_pool:
+        return []
     
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch('''
+            SELECT message
+            FROM sgi_logs
+            WHERE action_id = $1
+            ORDER BY timestamp ASC
+        ''', action_id)
+        
+        return [row['message'] for row in rows]
+
+# Intent understanding
+
+# Action keywords
+ACTION_KEYWORDS = {
+    'generate': ['generate', 'create', 'make', 'produce'],
+    'predict': ['predict', 'forecast', 'estimate'],
+    'analyze': ['analyze', 'examine', 'inspect', 'check'],
+    'scan': ['scan', 'search', 'find', 'discover', 'scout'],
+    'deploy': ['deploy', 'launch', 'start', 'run'],
+    'monitor': ['monitor', 'watch', 'track'],
+    'repair': ['repair', 'fix', 'heal', 'restore']
+}
+
+# Entity keywords
+ENTITY_KEYWORDS = {
+    'image': ['image', 'picture', 'photo', 'visual'],
+    'video': ['video', 'movie', 'clip', 'animation'],
+    'crypto': ['crypto', 'bitcoin', 'ethereum', 'btc', 'eth', 'cryptocurrency'],
+    'github': ['github', 'repository', 'repo', 'code'],
+    'research': ['research', 'paper', 'arxiv', 'study'],
+    'fraud': ['fraud', 'security', 'threat', 'anomaly']
+}
+
+# Crypto symbols recognised in messages, in match priority order
+CRYPTO_SYMBOLS = ('btc', 'eth', 'bitcoin', 'ethereum')
+
+def _compile_keywords(keyword_map: Dict[str, List[str]]):
+    """Compile one alternation per category, keeping the map's priority order"""
+    return tuple(
+        (name, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+        for name, keywords in keyword_map.items()
+    )
+
+ACTION_PATTERNS = _compile_keywords(ACTION_KEYWORDS)
+ENTITY_PATTERNS = _compile_keywords(ENTITY_KEYWORDS)
+
+def _match_keywords(message_lower: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return the first matching (action, entity) for a lowercased message"""
     detected_action = None
     detected_entity = None
-    confidence = 0.5  # Base confidence
     
     # Detect action
-    for action, keywords in action_keywords.items():
-        if any(kw in message_lower for kw in keywords):
+    for action, pattern in ACTION_PATTERNS:
+        if pattern.search(message_lower):
             detected_action = action
-            confidence += 0.2
             break
     
     # Detect entity
-    for entity, keywords in entity_keywords.items():
-        if any(kw in message_lower for kw in keywords):
+    for entity, pattern in ENTITY_PATTERNS:
+        if pattern.search(message_lower):
             detected_entity = entity
-            confidence += 0.2
             break
     
+    return detected_action, detected_entity
+
+def analyze_intent(message: str) -> Intent:
+    """
+    Analyze user message to understand intent
+    Uses keyword matching and pattern recognition
+    """
+    message_lower = message.lower()
+    
+    detected_action, detected_entity = _match_keywords(message_lower)
+    confidence = 0.5  # Base confidence
+    if detected_action:
+        confidence += 0.2
+    if detected_entity:
+        confidence += 0.2
+    
     # Determine intent type
     if detected_action and detected_entity:
         intent_type = "action"
@@ -285,8 +342,7 @@ def analyze_intent(message: str) -> Intent:
     parameters = {}
     if detected_entity == 'crypto':
         # Try to extract crypto symbol
-        symbols = ['btc', 'eth', 'bitcoin', 'ethereum']
-        for symbol in symbols:
+        for symbol in CRYPTO_SYMBOLS:
             if symbol in message_lower:
                 parameters['symbol'] = symbol.upper() if len(symbol) <= 3 else symbol.capitalize()
                 break
@@ -298,24 +354,31 @@ def analyze_intent(message: str) -> Intent:
         confidence=confidence
     )
 
+# Human-readable descriptions for action summaries
+ACTION_DESCRIPTIONS = {
+    'generate_image': 'Generate an image based on your prompt',
+    'generate_video': 'Generate a video based on your description',
+    'predict_crypto': 'Predict cryptocurrency price movements',
+    'analyze_fraud': 'Analyze data for fraud detection',
+    'scan_github': 'Scan GitHub repositories for relevant projects',
+    'scan_research': 'Search for relevant research papers',
+    'deploy': 'Deploy a service or component',
+    'monitor': 'Monitor system health and performance',
+    'repair': 'Attempt to repair detected issues'
+}
+
+# Intent types that create an action awaiting owner confirmation
+CONFIRMABLE_INTENT_TYPES = frozenset({"action", "command"})
+
+# Actions routed through the orchestrator
+ORCHESTRATED_ACTIONS = frozenset({'generate_image', 'generate_video', 'predict_crypto'})
+
 def generate_action_summary(intent: Intent, message: str) -> str:
     """Generate human-readable action summary"""
     if intent.type == "query":
         return f"This appears to be a query: '{message}'. No action required."
     
-    action_descriptions = {
-        'generate_image': 'Generate an image based on your prompt',
-        'generate_video': 'Generate a video based on your description',
-        'predict_crypto': 'Predict cryptocurrency price movements',
-        'analyze_fraud': 'Analyze data for fraud detection',
-        'scan_github': 'Scan GitHub repositories for relevant projects',
-        'scan_research': 'Search for relevant research papers',
-        'deploy': 'Deploy a service or component',
-        'monitor': 'Monitor system health and performance',
-        'repair': 'Attempt to repair detected issues'
-    }
-    
-    base_summary = action_descriptions.get(
+    base_summary = ACTION_DESCRIPTIONS.get(
         intent.action, 
         f"Execute action: {intent.action}"
     )
@@ -354,7 +417,7 @@ async def chat(message: ChatMessage) -> Dict[str, Any]:
         
         # Create action if it requires execution
         action_id = None
-        requires_confirmation = intent.type in ["action", "command"]
+        requires_confirmation = intent.type in CONFIRMABLE_INTENT_TYPES
         
         if requires_confirmation:
             action_id = str(uuid4())
@@ -412,7 +475,7 @@ async def confirm_action(confirmation: ActionConfirmation) -> ExecutionResult:
         if db_pool:
             async with db_pool.acquire() as conn:
                 row = await conn.fetchrow(
-                    'SELECT intent, summary FROM sgi_actions WHERE action_id = $1',
+                    'SELECT intent FROM sgi_actions WHERE action_id = $1',
                     action_id
                 )
                 if not row:
@@ -443,9 +506,8 @@ async def confirm_action(confirmation: ActionConfirmation) -> ExecutionResult:
             metadata={"result": result}
         ))
         
-        # Get all logs
-        logs = await get_action_logs(action_id)
-        log_messages = [log['message'] for log in logs]
+        # Get all log messages
+        log_messages = await get_action_log_messages(action_id)
         
         return ExecutionResult(
             action_id=action_id,
@@ -474,8 +536,6 @@ async def execute_action(action_id: str, intent: Intent,
     """
     Execute the actual action by delegating to appropriate services
     """
-    import httpx
-    
     # Service URLs
     services = {
         'orchestrator': os.getenv('ORCHESTRATOR_URL', 'http://orchestrator:5003'),
@@ -497,33 +557,31 @@ async def execute_action(action_id: str, intent: Intent,
     # Route to appropriate service based on action
     if intent.action and intent.action.startswith('scan_'):
         # Route to spy-orchestration service
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{services['spy_orchestration']}/scan",
-                json={
-                    "scan_type": intent.action.replace('scan_', ''),
-                    "parameters": parameters
-                },
-                timeout=300.0
-            )
-            return response.json()
+        response = await http_client.post(
+            f"{services['spy_orchestration']}/scan",
+            json={
+                "scan_type": intent.action.replace('scan_', ''),
+                "parameters": parameters
+            },
+            timeout=300.0
+        )
+        return response.json()
     
-    elif intent.action in ['generate_image', 'generate_video', 'predict_crypto']:
+    elif intent.action in ORCHESTRATED_ACTIONS:
         # Route through orchestrator
-        async with httpx.AsyncClient() as client:
-            task_type = intent.action.replace('generate_', '').replace('predict_', '')
-            response = await client.post(
-                f"{services['orchestrator']}/orchestrate",
-                json={
-                    "tasks": [{
-                        "type": f"{task_type}_generation" if 'generate' in intent.action else f"{task_type}_prediction",
-                        "params": parameters
-                    }],
-                    "priority": "high"
-                },
-                timeout=600.0
-            )
-            return response.json()
+        task_type = intent.action.replace('generate_', '').replace('predict_', '')
+        response = await http_client.post(
+            f"{services['orchestrator']}/orchestrate",
+            json={
+                "tasks": [{
+                    "type": f"{task_type}_generation" if 'generate' in intent.action else f"{task_type}_prediction",
+                    "params": parameters
+                }],
+                "priority": "high"
+            },
+            timeout=600.0
+        )
+        return response.json()
     
     else:
         # Generic action execution
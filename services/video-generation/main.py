@@ -6,10 +6,12 @@ Features: 8K video generation, dynamic camera rendering, 60fps
 
 from flask import Flask, request, jsonify
 import torch
-import os
 import logging
+import hashlib
+import json
+import itertools
+import time
 from datetime import datetime
-from typing import Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +26,8 @@ class VideoGenerator:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Initializing Video Generator on device: {self.device}")
         self.models = {}
+        # Sequence number keeps IDs unique within the same nanosecond tick
+        self._id_seq = itertools.count(1)
         self.load_models()
     
     def load_models(self):
@@ -72,9 +76,11 @@ class VideoGenerator:
             # Calculate frame count
             total_frames = duration * fps
             
+            # One clock read feeds both the ID and the timestamp
+            ns = time.time_ns()
             result = {
                 "status": "success",
-                "video_id": f"vid_{datetime.utcnow().timestamp()}",
+                "video_id": f"vid_{ns}_{next(self._id_seq)}",
                 "prompt": prompt,
                 "duration": duration,
                 "resolution": resolution,
@@ -82,7 +88,7 @@ class VideoGenerator:
                 "total_frames": total_frames,
                 "nerf_enabled": use_nerf,
                 "style": style,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcfromtimestamp(ns / 1e9).isoformat(),
                 "url": f"/outputs/videos/placeholder_{resolution}_{fps}fps.mp4",
                 "metadata": {
                     "device": self.device,
@@ -138,43 +144,57 @@ def generate():
         logger.error(f"Error in generate endpoint: {e}")
         return jsonify({"error": str(e)}), 500
 
+def catalog_etag(catalog) -> str:
+    """Compute a strong ETag for a static catalog"""
+    return hashlib.sha1(json.dumps(catalog, sort_keys=True).encode()).hexdigest()
+
+# Static model catalog served by /models
+AVAILABLE_MODELS = (
+    {
+        "name": "runway-gen2",
+        "version": "2.0",
+        "description": "Runway ML Gen-2 for text/image-to-video",
+        "features": ["8K support", "Realistic rendering", "Fast generation"]
+    },
+    {
+        "name": "nerf",
+        "version": "1.0",
+        "description": "Neural Radiance Fields for 3D scene rendering",
+        "features": ["Dynamic camera", "3D consistency", "View synthesis"]
+    },
+    {
+        "name": "video-diffusion",
+        "version": "1.0",
+        "description": "Diffusion models for video generation",
+        "features": ["Temporal consistency", "High quality", "Style control"]
+    }
+)
+
+AVAILABLE_MODELS_ETAG = catalog_etag(AVAILABLE_MODELS)
+
 @app.route('/models', methods=['GET'])
 def list_models():
     """List available video generation models"""
-    return jsonify({
-        "models": [
-            {
-                "name": "runway-gen2",
-                "version": "2.0",
-                "description": "Runway ML Gen-2 for text/image-to-video",
-                "features": ["8K support", "Realistic rendering", "Fast generation"]
-            },
-            {
-                "name": "nerf",
-                "version": "1.0",
-                "description": "Neural Radiance Fields for 3D scene rendering",
-                "features": ["Dynamic camera", "3D consistency", "View synthesis"]
-            },
-            {
-                "name": "video-diffusion",
-                "version": "1.0",
-                "description": "Diffusion models for video generation",
-                "features": ["Temporal consistency", "High quality", "Style control"]
-            }
-        ]
-    })
+    response = jsonify({"models": AVAILABLE_MODELS})
+    response.set_etag(AVAILABLE_MODELS_ETAG)
+    return response.make_conditional(request)
+
+# Static resolution catalog served by /resolutions
+SUPPORTED_RESOLUTIONS = (
+    {"name": "8K", "width": 7680, "height": 4320},
+    {"name": "4K", "width": 3840, "height": 2160},
+    {"name": "2K", "width": 2560, "height": 1440},
+    {"name": "1080p", "width": 1920, "height": 1080}
+)
+
+SUPPORTED_RESOLUTIONS_ETAG = catalog_etag(SUPPORTED_RESOLUTIONS)
 
 @app.route('/resolutions', methods=['GET'])
 def list_resolutions():
     """List supported video resolutions"""
-    return jsonify({
-        "resolutions": [
-            {"name": "8K", "width": 7680, "height": 4320},
-            {"name": "4K", "width": 3840, "height": 2160},
-            {"name": "2K", "width": 2560, "height": 1440},
-            {"name": "1080p", "width": 1920, "height": 1080}
-        ]
-    })
+    response = jsonify({"resolutions": SUPPORTED_RESOLUTIONS})
+    response.set_etag(SUPPORTED_RESOLUTIONS_ETAG)
+    return response.make_conditional(request)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5001, debug=False)
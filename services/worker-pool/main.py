@@ -7,13 +7,13 @@ from flask import Flask, request, jsonify
 import logging
 from datetime import datetime
 import os
-import json
 import requests
 import time
-from typing import Dict, Any, List, Optional
-from uuid import uuid4
-from threading import Thread
+import itertools
+import secrets
+from typing import Dict, Any, Optional, Set
 import queue
+from collections import Counter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,13 +24,18 @@ app = Flask(__name__)
 class Worker:
     """Base worker class for stateless task execution"""
     
+    __slots__ = (
+        'worker_id', 'worker_type', 'status', 'current_task',
+        'tasks_completed', 'created_at'
+    )
+    
     def __init__(self, worker_id: str, worker_type: str):
         self.worker_id = worker_id
         self.worker_type = worker_type
         self.status = 'idle'
         self.current_task = None
         self.tasks_completed = 0
-        self.created_at = datetime.utcnow().isoformat()
+        self.created_at = time.time()  # Formatted only when serialized
     
     def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a task"""
@@ -44,12 +49,14 @@ class Worker:
             'status': self.status,
             'current_task': self.current_task,
             'tasks_completed': self.tasks_completed,
-            'created_at': self.created_at
+            'created_at': datetime.utcfromtimestamp(self.created_at).isoformat()
         }
 
 class CrawlerWorker(Worker):
     """Worker for web crawling and data collection"""
     
+    __slots__ = ()
+    
     def __init__(self, worker_id: str):
         super().__init__(worker_id, 'crawler')
     
@@ -112,6 +119,21 @@ class CrawlerWorker(Worker):
 class AnalysisWorker(Worker):
     """Worker for data analysis tasks"""
     
+    __slots__ = ()
+    
+    # Analysis type -> simulated result fields
+    SIMULATED_RESULTS = {
+        'sentiment': {
+            'sentiment': 'positive',
+            'confidence': 0.75
+        },
+        'statistics': {
+            'mean': 0.5,
+            'median': 0.5,
+            'std_dev': 0.1
+        }
+    }
+    
     def __init__(self, worker_id: str):
         super().__init__(worker_id, 'analysis')
     
@@ -158,21 +180,17 @@ class AnalysisWorker(Worker):
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        if analysis_type == 'sentiment':
-            # Sentiment analysis simulation
-            result['sentiment'] = 'positive'
-            result['confidence'] = 0.75
-        elif analysis_type == 'statistics':
-            # Statistical analysis simulation
-            result['mean'] = 0.5
-            result['median'] = 0.5
-            result['std_dev'] = 0.1
+        simulated = self.SIMULATED_RESULTS.get(analysis_type)
+        if simulated:
+            result.update(simulated)
         
         return result
 
 class BenchmarkWorker(Worker):
     """Worker for performance benchmarking"""
     
+    __slots__ = ()
+    
     def __init__(self, worker_id: str):
         super().__init__(worker_id, 'benchmark')
     
@@ -212,7 +230,7 @@ class BenchmarkWorker(Worker):
     
     def _run_benchmark(self, benchmark_type: str, iterations: int) -> Dict[str, Any]:
         """Run benchmark test"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Simulate benchmark workload
         if benchmark_type == 'cpu':
@@ -221,7 +239,7 @@ class BenchmarkWorker(Worker):
         elif benchmark_type == 'memory':
             data = [0] * iterations * 1000
         
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         
         return {
             'benchmark_type': benchmark_type,
@@ -243,23 +261,41 @@ class WorkerPool:
             'analysis': AnalysisWorker,
             'benchmark': BenchmarkWorker
         }
+        # IDs of all / idle workers per type, so lookups never scan the pool
+        self.workers_by_type: Dict[str, Set[str]] = {
+            worker_type: set() for worker_type in self.worker_types
+        }
+        self.idle_workers: Dict[str, Set[str]] = {
+            worker_type: set() for worker_type in self.worker_types
+        }
+        # IDs only need to be unique within this process; a per-process salt
+        # plus a counter avoids a urandom read per ID
+        self._id_salt = secrets.token_hex(4)
+        self._id_counter = itertools.count()
         logger.info(f"Worker Pool initialized (max workers: {self.max_workers})")
     
-    def create_worker(self, worker_type: str) -> Optional[Worker]:
-        """Create a new worker of specified type"""
+    def generate_id(self, prefix: str) -> str:
+        """Generate a process-unique identifier"""
+        return f"{prefix}_{self._id_salt}{next(self._id_counter):08x}"
+    
+    def create_worker(self, worker_type: str, idle: bool = True) -> Optional[Worker]:
+        """Create a new worker of specified type; idle=False returns it already claimed"""
         if len(self.workers) >= self.max_workers:
             logger.warning("Worker pool at capacity")
             return None
         
-        if worker_type not in self.worker_types:
+        worker_class = self.worker_types.get(worker_type)
+        if worker_class is None:
             logger.error(f"Unknown worker type: {worker_type}")
             return None
         
-        worker_id = str(uuid4())
-        worker_class = self.worker_types[worker_type]
+        worker_id = self.generate_id('worker')
         worker = worker_class(worker_id)
         
         self.workers[worker_id] = worker
+        self.workers_by_type[worker_type].add(worker_id)
+        if idle:
+            self.idle_workers[worker_type].add(worker_id)
         logger.info(f"Created {worker_type} worker: {worker_id}")
         
         return worker
@@ -270,17 +306,26 @@ class WorkerPool:
     
     def dispose_worker(self, worker_id: str) -> bool:
         """Dispose of a worker"""
-        if worker_id in self.workers:
-            del self.workers[worker_id]
+        worker = self.workers.pop(worker_id, None)
+        if worker is not None:
+            self.workers_by_type[worker.worker_type].discard(worker_id)
+            self.idle_workers[worker.worker_type].discard(worker_id)
             logger.info(f"Disposed worker: {worker_id}")
             return True
         return False
     
     def get_idle_worker(self, worker_type: Optional[str] = None) -> Optional[Worker]:
-        """Get an idle worker of specified type"""
-        for worker in self.workers.values():
-            if worker.status == 'idle':
-                if worker_type is None or worker.worker_type == worker_type:
+        """Claim an idle worker of specified type"""
+        worker_types = self.idle_workers if worker_type is None else (worker_type,)
+        for wtype in worker_types:
+            idle = self.idle_workers.get(wtype)
+            while idle:
+                try:
+                    worker_id = idle.pop()
+                except KeyError:
+                    break
+                worker = self.workers.get(worker_id)
+                if worker is not None:
                     return worker
         return None
     
@@ -289,9 +334,10 @@ class WorkerPool:
         # Try to find idle worker of the requested type
         worker = self.get_idle_worker(worker_type)
         
-        # If no idle worker, create a new one
+        # If no idle worker, create one that never enters the idle set, so no
+        # concurrent request can claim it before this task runs
         if worker is None:
-            worker = self.create_worker(worker_type)
+            worker = self.create_worker(worker_type, idle=False)
         
         if worker is None:
             return {
@@ -309,19 +355,20 @@ class WorkerPool:
     
     def get_pool_status(self) -> Dict[str, Any]:
         """Get status of worker pool"""
+        # Count every status in a single pass over the pool
+        status_counts = Counter(w.status for w in self.workers.values())
         status = {
             'total_workers': len(self.workers),
             'max_workers': self.max_workers,
-            'idle_workers': sum(1 for w in self.workers.values() if w.status == 'idle'),
-            'working_workers': sum(1 for w in self.workers.values() if w.status == 'working'),
-            'workers_by_type': {},
+            'idle_workers': status_counts['idle'],
+            'working_workers': status_counts['working'],
+            'workers_by_type': {
+                worker_type: len(worker_ids)
+                for worker_type, worker_ids in self.workers_by_type.items()
+            },
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        for worker_type in self.worker_types.keys():
-            count = sum(1 for w in self.workers.values() if w.worker_type == worker_type)
-            status['workers_by_type'][worker_type] = count
-        
         return status
 
 # Initialize worker pool
@@ -383,7 +430,7 @@ def execute_task():
     
     worker_type = data.get('worker_type', 'crawler')
     task = data.get('task', {})
-    task['task_id'] = str(uuid4())
+    task['task_id'] = worker_pool.generate_id('task')
     
     result = worker_pool.assign_task(worker_type, task)
     